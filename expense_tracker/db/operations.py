@@ -2,6 +2,7 @@ from sqlalchemy.orm import sessionmaker, Session, DeclarativeMeta
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy import and_
 
+import operator
 from typing import Type, List, Optional, Generator, Tuple, Any
 
 from .connection import get_db_engine
@@ -12,6 +13,16 @@ SessionLocal = sessionmaker(bind=engine)
 
 logger = setup_logger('database_operations', 'database_operations.log')
 
+# Comparison operators accepted by BaseOperations.query as [op, value] filters
+COMPARISON_OPERATORS = {
+    '>': operator.gt,
+    '<': operator.lt,
+    '>=': operator.ge,
+    '<=': operator.le,
+    '==': operator.eq,
+    '!=': operator.ne,
+}
+
 
 def get_db() -> Generator[Session, None, None]:
     """
@@ -43,6 +54,9 @@ class BaseOperations:
         create(db, model_class, **kwargs) -> DeclarativeMeta:
             Creates a new instance of the given model class with the provided attributes.
 
+        create_fast(db, model_class, **kwargs) -> DeclarativeMeta:
+            Creates a new instance and flushes it, leaving the commit to the caller.
+
         read(db, model_class, instance_id) -> Optional[DeclarativeMeta]:
             Retrieves an instance of the given model class by its ID.
 
@@ -55,6 +69,9 @@ class BaseOperations:
         get_all(db, model_class, page, per_page) -> Tuple[List[DeclarativeMeta], int]:
             Retrieves all instances of the given model class with pagination.
 
+        get_id_name(db, model_class, page, per_page) -> List[Tuple[int, str]]:
+            Retrieves only the ID and name of instances of the given model class with pagination.
+
         query(db, model_class, page, per_page, **filters) -> Tuple[List[DeclarativeMeta], int]:
             Queries instances of the given model class with optional filters and pagination.
     """
@@ -80,7 +97,42 @@ class BaseOperations:
             db.add(new_instance)
             db.commit()
             db.refresh(new_instance)
-            logger.info(f"Created new {model_class.__name__}: ID {new_instance.id}, Attributes: {kwargs}")
+            logger.info("Created new %s: ID %s, Attributes: %s", model_class.__name__, new_instance.id, kwargs)
+            return new_instance
+        except SQLAlchemyError as e:
+            logger.error(f"Database error creating {model_class.__name__}: {e}", exc_info=True)
+            db.rollback()
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error creating {model_class.__name__}: {e}", exc_info=True)
+            db.rollback()
+            raise
+
+    @staticmethod
+    def create_fast(
+        db: Session,
+        model_class: Type[DeclarativeMeta],
+        **kwargs: Any,
+    ) -> DeclarativeMeta:
+        """
+        Create a new instance of the given model class without committing.
+
+        The instance is flushed so its ID is populated, but it is neither committed
+        nor refreshed from the database. The caller owns the transaction.
+
+        Args:
+            db (Session): The database session.
+            model_class (Type[DeclarativeMeta]): The SQLAlchemy model class.
+            **kwargs: Attributes for the new instance.
+
+        Returns:
+            DeclarativeMeta: The newly created instance.
+        """
+        try:
+            new_instance = model_class(**kwargs)
+            db.add(new_instance)
+            db.flush()
+            logger.info("Created new %s: ID %s, Attributes: %s", model_class.__name__, new_instance.id, kwargs)
             return new_instance
         except SQLAlchemyError as e:
             logger.error(f"Database error creating {model_class.__name__}: {e}", exc_info=True)
@@ -111,10 +163,10 @@ class BaseOperations:
         try:
             instance = db.query(model_class).filter(model_class.id == instance_id).first()
             if instance:
-                logger.info(f"Retrieved {model_class.__name__}: ID {instance_id}, Attributes: {instance.__dict__}")
+                logger.info("Retrieved %s: ID %s, Attributes: %s", model_class.__name__, instance_id, instance.__dict__)
                 return instance
             else:
-                logger.warning(f"{model_class.__name__} not found: ID {instance_id}")
+                logger.warning("%s not found: ID %s", model_class.__name__, instance_id)
                 return None
         except SQLAlchemyError as e:
             logger.error(f"Database error reading {model_class.__name__} ID {instance_id}: {e}", exc_info=True)
@@ -148,11 +200,11 @@ class BaseOperations:
                 for key, value in kwargs.items():
                     setattr(instance, key, value)
                 db.commit()
-                logger.info(
-                    f"Updated {model_class.__name__}: ID {instance_id}. Fields updated: {', '.join(kwargs.keys())}, New values: {kwargs}")
+                logger.info("Updated %s: ID %s. Fields updated: %s, New values: %s",
+                            model_class.__name__, instance_id, ', '.join(kwargs.keys()), kwargs)
                 return instance
             else:
-                logger.warning(f"{model_class.__name__} not found for update: ID {instance_id}")
+                logger.warning("%s not found for update: ID %s", model_class.__name__, instance_id)
                 return None
         except SQLAlchemyError as e:
             logger.error(f"Database error updating {model_class.__name__} ID {instance_id}: {e}", exc_info=True)
@@ -185,10 +237,10 @@ class BaseOperations:
             if instance:
                 db.delete(instance)
                 db.commit()
-                logger.info(f"Deleted {model_class.__name__}: ID {instance_id}")
+                logger.info("Deleted %s: ID %s", model_class.__name__, instance_id)
                 return True
             else:
-                logger.warning(f"{model_class.__name__} not found for deletion: ID {instance_id}")
+                logger.warning("%s not found for deletion: ID %s", model_class.__name__, instance_id)
                 return False
         except SQLAlchemyError as e:
             logger.error(f"Database error deleting {model_class.__name__}: {e}", exc_info=True)
@@ -222,8 +274,8 @@ class BaseOperations:
             query = db.query(model_class)
             total = query.count()
             instances = query.offset((page - 1) * per_page).limit(per_page).all()
-            logger.info(
-                f"Retrieved {model_class.__name__} instances. Page {page}, {len(instances)} items. Total: {total}")
+            logger.info("Retrieved %s instances. Page %s, %s items. Total: %s",
+                        model_class.__name__, page, len(instances), total)
             return instances, total
         except SQLAlchemyError as e:
             logger.error(f"Database error retrieving {model_class.__name__} instances: {e}", exc_info=True)
@@ -232,6 +284,44 @@ class BaseOperations:
             logger.error(f"Unexpected error retrieving {model_class.__name__} instances: {e}", exc_info=True)
             raise
 
+    @staticmethod
+    def get_id_name(
+        db: Session,
+        model_class: Type[DeclarativeMeta],
+        page: int = 1,
+        per_page: int = 10,
+    ) -> List[Tuple[int, str]]:
+        """
+        Retrieve the ID and name of instances of the given model class with pagination.
+
+        Only the two columns are selected, so no ORM instances are built. Useful for
+        listing choices to the user.
+
+        Args:
+            db (Session): The database session.
+            model_class (Type[DeclarativeMeta]): The SQLAlchemy model class. Must have a name column.
+            page (int): The page number (1-indexed).
+            per_page (int): The number of items per page.
+
+        Returns:
+            List[Tuple[int, str]]: A list of (id, name) tuples.
+        """
+        try:
+            rows = (
+                db.query(model_class.id, model_class.name)
+                .offset((page - 1) * per_page)
+                .limit(per_page)
+                .all()
+            )
+            logger.info("Retrieved %s IDs and names. Page %s, %s items", model_class.__name__, page, len(rows))
+            return [tuple(row) for row in rows]
+        except SQLAlchemyError as e:
+            logger.error(f"Database error retrieving {model_class.__name__} IDs and names: {e}", exc_info=True)
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error retrieving {model_class.__name__} IDs and names: {e}", exc_info=True)
+            raise
+
     @staticmethod
     def query(
         db: Session,
@@ -253,39 +343,27 @@ class BaseOperations:
         Returns:
             Tuple[List[DeclarativeMeta], int]: A tuple containing the list of instances and the total count.
         """
-        # Refactor this. Maybe add a method for all the comparisons.
         try:
             query = db.query(model_class)
             filter_conditions = []
             for attr, value in filters.items():
+                column = getattr(model_class, attr)
                 if isinstance(value, (list, tuple)):
-                    if len(value) == 2 and value[0] in ['>', '<', '>=', '<=', '==', '!=']:
+                    if len(value) == 2 and value[0] in COMPARISON_OPERATORS:
                         op, val = value
-                        column = getattr(model_class, attr)
-                        if op == '>':
-                            filter_conditions.append(column > val)
-                        elif op == '<':
-                            filter_conditions.append(column < val)
-                        elif op == '>=':
-                            filter_conditions.append(column >= val)
-                        elif op == '<=':
-                            filter_conditions.append(column <= val)
-                        elif op == '==':
-                            filter_conditions.append(column == val)
-                        elif op == '!=':
-                            filter_conditions.append(column != val)
+                        filter_conditions.append(COMPARISON_OPERATORS[op](column, val))
                     else:
-                        filter_conditions.append(getattr(model_class, attr).in_(value))
+                        filter_conditions.append(column.in_(value))
                 else:
-                    filter_conditions.append(getattr(model_class, attr) == value)
+                    filter_conditions.append(column == value)
 
             if filter_conditions:
                 query = query.filter(and_(*filter_conditions))
 
             total = query.count()
             instances = query.offset((page - 1) * per_page).limit(per_page).all()
-            logger.info(
-                f"Queried {model_class.__name__} with filters: {filters}. Page {page}, {len(instances)} items. Total: {total}")
+            logger.info("Queried %s with filters: %s. Page %s, %s items. Total: %s",
+                        model_class.__name__, filters, page, len(instances), total)
             return instances, total
         except SQLAlchemyError as e:
             logger.error(f"Database error querying {model_class.__name__} with filters {filters}: {e}", exc_info=True)
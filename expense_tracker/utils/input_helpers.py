@@ -1,14 +1,26 @@
-from typing import List, Tuple, Type, Any, Union
-from datetime import datetime
+from typing import Type, Any, Union, FrozenSet
+from datetime import datetime, date
 import enum
+import math
+import re
 from sqlalchemy.orm import Session
-from sqlalchemy import inspect
 
 from expense_tracker.models import Base
 from expense_tracker.db.operations import BaseOperations
-from expense_tracker.utils.validation import check_number_range, check_string_length, user_validation_message
+from expense_tracker.utils.validation import check_string_length, user_validation_message
 
 EXIT_COMMANDS = ('exit', 'quit')
+_EXIT_COMMAND_SET = frozenset(EXIT_COMMANDS)
+# First characters of the exit commands, used to skip lower() for ordinary input
+_EXIT_INITIALS = frozenset(c for command in EXIT_COMMANDS for c in (command[0], command[0].upper()))
+
+# Messages shown when input is rejected, built once at import
+EXIT_HINT = ' / '.join(EXIT_COMMANDS)
+INVALID_INT_MSG = f"Invalid input. Please enter a valid number (integer) or {EXIT_HINT} to quit."
+INVALID_FLOAT_MSG = f"Invalid input. Please enter a valid number (float) or {EXIT_HINT} to quit."
+INVALID_STRING_MSG = f"Invalid input. Please try again or type {EXIT_HINT} to quit."
+INVALID_DATE_MSG = f"Invalid date format. Please use YYYY-MM-DD or {EXIT_HINT} to quit."
+INTERRUPT_MSG = f"\nInput interrupted. Please try again or type {EXIT_HINT} to quit."
 
 
 def is_exit_command(value: str) -> bool:
@@ -17,7 +29,30 @@ def is_exit_command(value: str) -> bool:
 
     Returns True if an exit command was entered, otherwise False.
     """
-    return value.lower() in EXIT_COMMANDS
+    if value[:1] not in _EXIT_INITIALS:
+        return False
+    return value.lower() in _EXIT_COMMAND_SET
+
+
+# Matches everything float() accepts apart from underscore digit separators
+_FLOAT_PATTERN = re.compile(r'[+-]?(?:(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?|inf(?:inity)?|nan)', re.IGNORECASE)
+
+
+def _is_int_literal(value: str) -> bool:
+    """
+    Checks if a string can be parsed by int(), without raising an exception for bad input.
+    """
+    digits = value.strip()
+    if digits[:1] in ('+', '-'):
+        digits = digits[1:]
+    return digits.isdecimal()
+
+
+def _is_float_literal(value: str) -> bool:
+    """
+    Checks if a string can be parsed by float(), without raising an exception for bad input.
+    """
+    return _FLOAT_PATTERN.fullmatch(value.strip()) is not None
 
 
 def validate_string(value: str, min_length: int = 1) -> bool:
@@ -28,11 +63,14 @@ def validate_number(value: float, min_value: float = 0) -> bool:
     return value >= min_value
 
 
-def validate_date(value: datetime.date) -> bool:
+def validate_date(value: Union[date, str]) -> bool:
+    # A datetime has a time part, so like any other non-date value it is not a valid date
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return True
     try:
-        datetime.strptime(str(value), "%Y-%m-%d")
+        datetime.strptime(value, "%Y-%m-%d")
         return True
-    except ValueError:
+    except (TypeError, ValueError):
         return False
 
 
@@ -40,119 +78,164 @@ def validate_enum(value: enum.Enum) -> bool:
     return isinstance(value, enum.Enum)
 
 
+def safe_input(prompt: str) -> str:
+    """
+    Reads a line of user input.
+
+    Every prompt function reads through here rather than calling input() directly,
+    so tests can script the user's responses without patching builtins.
+    """
+    return input(prompt)
+
+
+def get_int(
+        prompt: str,
+        min_value: Union[int, None] = None,
+        max_value: Union[int, None] = None
+) -> Union[int, str]:
+    # Bind the input, print and helper functions used in the retry loop to locals once per call
+    _input, _print, _int, _is_exit = safe_input, print, int, is_exit_command
+    # Open bounds become infinities, so each retry is a single chained comparison
+    lower = -math.inf if min_value is None else min_value
+    upper = math.inf if max_value is None else max_value
+    while True:
+        try:
+            value = _input(prompt)
+            if _is_exit(value):
+                return 'exit'
+
+            # Reject malformed input up front rather than paying for a ValueError
+            if not _is_int_literal(value):
+                _print(INVALID_INT_MSG)
+                continue
+
+            int_value = _int(value)
+            if not lower <= int_value <= upper:
+                _print(user_validation_message(int_value, min_value, max_value))
+            else:
+                return int_value
+        except ValueError:
+            _print(INVALID_INT_MSG)
+        except (EOFError, KeyboardInterrupt):
+            _print(INTERRUPT_MSG)
+
+
+def get_float(
+        prompt: str,
+        min_value: Union[float, None] = None,
+        max_value: Union[float, None] = None
+) -> Union[float, str]:
+    _input, _print, _float, _is_exit = safe_input, print, float, is_exit_command
+    lower = -math.inf if min_value is None else min_value
+    upper = math.inf if max_value is None else max_value
+    while True:
+        try:
+            value = _input(prompt)
+            if _is_exit(value):
+                return 'exit'
+
+            if not _is_float_literal(value):
+                _print(INVALID_FLOAT_MSG)
+                continue
+
+            float_value = _float(value)
+            if not lower <= float_value <= upper:
+                _print(user_validation_message(float_value, min_value, max_value))
+            else:
+                return float_value
+        except ValueError:
+            _print(INVALID_FLOAT_MSG)
+        except (EOFError, KeyboardInterrupt):
+            _print(INTERRUPT_MSG)
+
+
+def get_string(
+        prompt: str,
+        min_length: Union[int, None] = None,
+        max_length: Union[int, None] = None
+) -> str:
+    _input, _print, _is_exit = safe_input, print, is_exit_command
+    check_length = min_length is not None or max_length is not None
+    while True:
+        try:
+            value = _input(prompt).strip()
+            if _is_exit(value):
+                return 'exit'
+
+            if check_length and not check_string_length(value, min_length, max_length):
+                _print(user_validation_message(value, min_length, max_length))
+            else:
+                return value
+        except ValueError:
+            _print(INVALID_STRING_MSG)
+        except (EOFError, KeyboardInterrupt):
+            _print(INTERRUPT_MSG)
+
+
+def get_date(prompt: str) -> Union[date, str]:
+    _input, _print, _strptime, _is_exit = safe_input, print, datetime.strptime, is_exit_command
+    while True:
+        try:
+            date_string = _input(prompt).strip()
+            if _is_exit(date_string):
+                return 'exit'
+            return _strptime(date_string, "%Y-%m-%d").date()
+        except ValueError:
+            _print(INVALID_DATE_MSG)
+        except (EOFError, KeyboardInterrupt):
+            _print(INTERRUPT_MSG)
+
+
 class UserInput:
-    @staticmethod
-    def get_int(
-            prompt: str,
-            min_value: Union[int, None] = None,
-            max_value: Union[int, None] = None
-    ) -> Union[int, str]:
-        while True:
-            try:
-                value = input(prompt)
-                if is_exit_command(value):
-                    return 'exit'
-
-                int_value = int(value)
-                if (min_value is not None or max_value is not None) and not check_number_range(int_value, min_value,
-                                                                                               max_value):
-                    print(user_validation_message(int_value, min_value, max_value))
-                else:
-                    return int_value
-            except ValueError:
-                print(f"Invalid input. Please enter a valid number (integer) or {' / '.join(EXIT_COMMANDS)} to quit.")
-            except (EOFError, KeyboardInterrupt):
-                print(f"\nInput interrupted. Please try again or type {' / '.join(EXIT_COMMANDS)} to quit.")
-
-    @staticmethod
-    def get_float(
-            prompt: str,
-            min_value: Union[float, None] = None,
-            max_value: Union[float, None] = None
-    ) -> Union[float, str]:
-        while True:
-            try:
-                value = input(prompt)
-                if is_exit_command(value):
-                    return 'exit'
-
-                float_value = float(value)
-                if (min_value is not None or max_value is not None) and not check_number_range(float_value, min_value,
-                                                                                               max_value):
-                    print(user_validation_message(float_value, min_value, max_value))
-                else:
-                    return float_value
-            except ValueError:
-                print(f"Invalid input. Please enter a valid number (float) or {' / '.join(EXIT_COMMANDS)} to quit.")
-            except (EOFError, KeyboardInterrupt):
-                print(f"\nInput interrupted. Please try again or type {' / '.join(EXIT_COMMANDS)} to quit.")
-
-    @staticmethod
-    def get_string(
-            prompt: str,
-            min_length: Union[int, None] = None,
-            max_length: Union[int, None] = None
-    ) -> str:
-        while True:
-            try:
-                value = input(prompt).strip()
-                if is_exit_command(value):
-                    return 'exit'
-
-                if (min_length is not None or max_length is not None) and not check_string_length(value, min_length,
-                                                                                                  max_length):
-                    print(user_validation_message(value, min_length, max_length))
-                else:
-                    return value
-            except ValueError:
-                print(f"Invalid input. Please try again or type {' / '.join(EXIT_COMMANDS)} to quit.")
-            except (EOFError, KeyboardInterrupt):
-                print(f"\nInput interrupted. Please try again or type {' / '.join(EXIT_COMMANDS)} to quit.")
-
-    @staticmethod
-    def get_date(prompt: str) -> Union[datetime.date, str]:
-        while True:
-            try:
-                date_string = input(prompt).strip()
-                if is_exit_command(date_string):
-                    return 'exit'
-                return datetime.strptime(str(date_string), "%Y-%m-%d").date()
-            except ValueError:
-                print(f"Invalid date format. Please use YYYY-MM-DD or {' / '.join(EXIT_COMMANDS)} to quit.")
-            except (EOFError, KeyboardInterrupt):
-                print(f"\nInput interrupted. Please try again or type {' / '.join(EXIT_COMMANDS)} to quit.")
-
-
-def display_model_instances(session: Session, model: Type[Base]) -> bool:
-    instances, total = BaseOperations.get_all(session, model)
-    if total == 0:
+    """
+    Namespace for the prompt functions, kept for existing callers.
+    """
+    get_int = staticmethod(get_int)
+    get_float = staticmethod(get_float)
+    get_string = staticmethod(get_string)
+    get_date = staticmethod(get_date)
+
+
+def display_model_instances(session: Session, model: Type[Base]) -> FrozenSet[int]:
+    """
+    Prints the available instances of a model.
+
+    Returns the IDs of the printed instances, or an empty set if there are none.
+    """
+    rows = BaseOperations.get_id_name(session, model)
+    if not rows:
         print(f"\nNo {model.__name__} instances available. Please create one first.")
-        return False
+        return frozenset()
 
     print(f"\nAvailable {model.__name__} instances:")
-    for instance in instances:
-        print(f"ID: {instance.id} - Name: {instance.name}")
+    print("\n".join(f"ID: {instance_id} - Name: {name}" for instance_id, name in rows))
 
     print()
-    return True
+    return frozenset(instance_id for instance_id, _ in rows)
 
 
-def get_model_instance_id(session: Session, model: Type[Base], prompt: str) -> Union[int, str]:
+def get_model_instance_id(
+        session: Session,
+        model: Type[Base],
+        prompt: str,
+        valid_ids: FrozenSet[int] = frozenset()
+) -> Union[int, str]:
     while True:
         instance_id = UserInput.get_int(prompt)
         if instance_id == 'exit':
             return 'exit'
 
-        instance = BaseOperations.read(session, model, instance_id)
-        if instance:
+        # IDs that were just listed are known to exist; only look up anything else
+        if instance_id in valid_ids or BaseOperations.read(session, model, instance_id):
             return instance_id
         print(f"Invalid {model.__name__} ID. Please try again.")
 
 
 def get_related_instance_id(session: Session, model: Type[Base]) -> Union[int, str]:
-    if not display_model_instances(session, model):
+    valid_ids = display_model_instances(session, model)
+    if not valid_ids:
         return None
-    return get_model_instance_id(session, model, f"Enter the ID of the {model.__name__}: ")
+    return get_model_instance_id(session, model, f"Enter the ID of the {model.__name__}: ", valid_ids)
 
 
 def get_enum_value(enum_class: Type[enum.Enum], prompt: str) -> Any:
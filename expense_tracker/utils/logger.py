@@ -1,39 +1,192 @@
+import functools
 import logging
 import os
+import sys
+import threading
+import time
+import traceback
+import weakref
 from logging.handlers import RotatingFileHandler
+from pathlib import Path
 
 """
 This module provides a utility function for setting up logging in the application.
 
 It configures a logger with both file and console handlers, using a rotating file handler
 to manage log file sizes.
+
+On frequently called paths, pass values as arguments (logger.info("ID %s", instance_id))
+rather than building an f-string. The message is then only formatted if the record is
+actually emitted.
 """
 
 # Define the default logs directory
-DEFAULT_LOGS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'logs')
+DEFAULT_LOGS_DIR = Path(__file__).resolve().parent.parent / 'logs'
+
+# Size of the write buffer for log files, and how often (in seconds) buffered records are flushed
+LOG_BUFFER_SIZE = 65536
+LOG_FLUSH_INTERVAL = 0.2
+
+_buffered_handlers = weakref.WeakSet()
+_flusher_lock = threading.Lock()
+_flusher_thread = None
+
+
+def _flush_buffered_handlers():
+    """
+    Periodically flush every open FastRotatingFileHandler.
+
+    Runs forever in a daemon thread. Records still buffered when the interpreter exits
+    are written out by logging.shutdown, which flushes and closes all handlers.
+
+    A handler that fails to flush is reported the way Handler.handleError reports a
+    failed emit, and the thread carries on with the other handlers.
+    """
+    while True:
+        time.sleep(LOG_FLUSH_INTERVAL)
+        # Handlers are added and closed from other threads while this one runs
+        with _flusher_lock:
+            handlers = list(_buffered_handlers)
+        for handler in handlers:
+            try:
+                handler.flush()
+            except Exception:
+                if logging.raiseExceptions and sys.stderr:
+                    sys.stderr.write('--- Logging error ---\n')
+                    traceback.print_exc(file=sys.stderr)
+
+
+def _start_flusher():
+    global _flusher_thread
+    with _flusher_lock:
+        if _flusher_thread is None:
+            _flusher_thread = threading.Thread(target=_flush_buffered_handlers, name='log-flusher', daemon=True)
+            _flusher_thread.start()
+
+
+class FastRotatingFileHandler(RotatingFileHandler):
+    """
+    A RotatingFileHandler that tracks the size of the log file in memory and buffers writes.
+
+    The standard handler checks the filesystem and seeks to the end of the stream
+    for every record it emits. This handler keeps a running size instead, and only
+    checks the file itself once a record would bring it close to maxBytes. Sizes are
+    counted in encoded bytes, so non-ASCII records can't push a file past maxBytes.
+
+    Writes go through a LOG_BUFFER_SIZE buffer that is flushed every LOG_FLUSH_INTERVAL
+    seconds by a background thread, rather than after every record. The thread is started
+    by the first record that is left buffered. ERROR records and above are still flushed
+    immediately.
+    """
+    _defer_flush = False
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        with _flusher_lock:
+            _buffered_handlers.add(self)
+
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, buffering=LOG_BUFFER_SIZE,
+                      encoding=self.encoding, errors=self.errors)
+        self._size = os.path.getsize(self.baseFilename)
+        return stream
+
+    def emit(self, record):
+        # StreamHandler.emit flushes after every record; leave that to the flusher thread
+        self._defer_flush = record.levelno < logging.ERROR
+        # The flusher thread is only needed once something is left in a buffer
+        if self._defer_flush and _flusher_thread is None:
+            _start_flusher()
+        try:
+            super().emit(record)
+        finally:
+            self._defer_flush = False
+
+    def flush(self):
+        if not self._defer_flush:
+            super().flush()
+
+    def close(self):
+        with _flusher_lock:
+            _buffered_handlers.discard(self)
+        super().close()
+
+    def shouldRollover(self, record):
+        """
+        Determine if rollover should occur, without touching the filesystem in the common case.
+
+        Args:
+            record (logging.LogRecord): The record about to be emitted.
+
+        Returns:
+            bool: True if the file should be rolled over before emitting the record.
+        """
+        if self.maxBytes <= 0:
+            return False
+        if self.stream is None:
+            self.stream = self._open()
+
+        # maxBytes is in bytes, so measure the record as it will be encoded on disk
+        msg = self.format(record) + self.terminator
+        self._record_size = len(msg.encode(self.stream.encoding, self.stream.errors))
+        if self._size + self._record_size < self.maxBytes:
+            self._size += self._record_size
+            return False
+
+        # Resync with the real file size in case it was written to elsewhere, then
+        # make the same checks as RotatingFileHandler, counting bytes rather than characters
+        self._size = self.stream.seek(0, os.SEEK_END)
+        if self._size + self._record_size >= self.maxBytes:
+            # See bpo-45401: never roll over anything other than a regular file
+            return not (os.path.exists(self.baseFilename) and not os.path.isfile(self.baseFilename))
+
+        self._size += self._record_size
+        return False
+
+    def doRollover(self):
+        super().doRollover()
+        # The record that triggered the rollover is written to the new file
+        self._size += self._record_size
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_log_path(logs_dir, log_file):
+    """
+    Create the logs directory if it doesn't already exist and return the full path of the log file.
+
+    The result is cached, so the directory is only checked the first time each log file is set up.
+    """
+    logs_dir = Path(logs_dir)
+    logs_dir.mkdir(parents=True, exist_ok=True)
+    return logs_dir / log_file
 
 
 def setup_logger(name, log_file, level=logging.INFO, logs_dir=DEFAULT_LOGS_DIR):
     """
     Set up a logger with file and console handlers.
 
+    Calling this again for a logger that already has handlers returns it unchanged,
+    so handlers are never added twice.
+
     Args:
         name (str): The name of the logger.
         log_file (str): The name of the log file (not full path).
         level (int): The logging level (default: logging.INFO).
-        logs_dir (str): The directory for log files (default: DEFAULT_LOGS_DIR).
+        logs_dir (str | Path): The directory for log files (default: DEFAULT_LOGS_DIR).
 
     Returns:
         logging.Logger: Configured logger object.
     """
-    # Constructs the logs directory, if it doesn't already exist
-    os.makedirs(logs_dir, exist_ok=True)
-    log_path = os.path.join(logs_dir, log_file)
+    logger = logging.getLogger(name)
+    if logger.handlers:
+        return logger
+
+    log_path = _ensure_log_path(logs_dir, log_file)
 
     formatter = logging.Formatter('%(asctime)s %(levelname)s: %(message)s')
 
     # File handler for all logs
-    file_handler = RotatingFileHandler(log_path, maxBytes=10000000, backupCount=5)
+    file_handler = FastRotatingFileHandler(log_path, maxBytes=10000000, backupCount=5)
     file_handler.setFormatter(formatter)
 
     # Console handler for error logs
@@ -41,7 +194,6 @@ def setup_logger(name, log_file, level=logging.INFO, logs_dir=DEFAULT_LOGS_DIR):
     console_handler.setFormatter(formatter)
     console_handler.setLevel(logging.ERROR)
 
-    logger = logging.getLogger(name)
     logger.setLevel(level)
     logger.addHandler(file_handler)
     logger.addHandler(console_handler)
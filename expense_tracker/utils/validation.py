@@ -54,6 +54,19 @@ def check_string_length(
         return True
 
 
+# Message templates keyed by (value is a string, min_value given, max_value given)
+_VALIDATION_TEMPLATES = {
+    (False, True, True): "Please enter a value between {min_value} and {max_value}.",
+    (False, True, False): "Please enter a value greater than or equal to {min_value}.",
+    (False, False, True): "Please enter a value less than or equal to {max_value}.",
+    (True, True, True): "Please enter a string with a length between {min_value} and {max_value}.",
+    (True, True, False): "Please enter a string with a length greater than or equal to {min_value}.",
+    (True, False, True): "Please enter a string with a length less than or equal to {max_value}.",
+}
+
+DEFAULT_VALIDATION_MESSAGE = "The input does not meet the validation criteria."
+
+
 def user_validation_message(
     value: int | float | str,
     min_value: int | float | None = None,
@@ -70,22 +83,10 @@ def user_validation_message(
     Returns:
         str: The message to display, based on the results of the check.
     """
-    base_message = "Please enter a"
-    if isinstance(value, str):
-        base_message += " string with a length"
-        comparison_value = len(value)
-    else:
-        base_message += " value"
-        comparison_value = value
-
-    if min_value is not None and max_value is not None:
-        if not (min_value <= comparison_value <= max_value):
-            return f"{base_message} between {min_value} and {max_value}."
-    elif min_value is not None:
-        if not (min_value <= comparison_value):
-            return f"{base_message} greater than or equal to {min_value}."
-    elif max_value is not None:
-        if not (comparison_value <= max_value):
-            return f"{base_message} less than or equal to {max_value}."
+    is_string = isinstance(value, str)
+    template = _VALIDATION_TEMPLATES.get((is_string, min_value is not None, max_value is not None))
+    comparison_value = len(value) if is_string else value
 
-    return "The input does not meet the validation criteria."
+    if template is None or check_number_range(comparison_value, min_value, max_value):
+        return DEFAULT_VALIDATION_MESSAGE
+    return template.format(min_value=min_value, max_value=max_value)
@@ -0,0 +1,134 @@
+import pytest
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from expense_tracker.models import Base, Account, Category
+from expense_tracker.db.operations import BaseOperations
+
+
+@pytest.fixture(scope="session")
+def engine():
+    # Every connection must see the same in-memory database, so hand out a single
+    # underlying sqlite3 connection rather than relying on the default pool.
+    # Each pytest-xdist worker is its own process, so it gets its own database.
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    # pysqlite manages transactions itself, which breaks SAVEPOINT rollback.
+    # Hand transaction control to SQLAlchemy instead.
+    @event.listens_for(engine, "connect")
+    def do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        # Keep temporary tables and indices (e.g. for sorting) in memory as well
+        dbapi_connection.execute("PRAGMA temp_store=MEMORY")
+
+    @event.listens_for(engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    return engine
+
+
+@pytest.fixture(scope="session")
+def tables(engine):
+    # The schema is created once for the whole test run
+    Base.metadata.create_all(engine)
+    yield
+    Base.metadata.drop_all(engine)
+
+
+@pytest.fixture(scope="session")
+def connection(engine, tables):
+    # One connection and outer transaction for the whole run; nothing is ever committed.
+    # Closing the connection rolls the transaction back.
+    with engine.connect() as connection:
+        connection.begin()
+        yield connection
+
+
+@pytest.fixture(scope="session")
+def session_factory(connection):
+    # Sessions always join the shared connection through a SAVEPOINT. Objects are not
+    # expired on commit, so reading them back afterwards doesn't issue another SELECT.
+    # BaseOperations commits or flushes every write itself, so autoflush before each
+    # query has nothing to do.
+    return sessionmaker(
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
+@pytest.fixture
+def dbsession(connection, session_factory):
+    """
+    Provide a session whose changes are rolled back at the end of each test.
+
+    Each test runs in its own SAVEPOINT on the shared connection. The session joins it
+    through a further SAVEPOINT, so a commit from the code under test only releases
+    that one, and rolling back the test's SAVEPOINT undoes everything.
+    """
+    with connection.begin_nested() as savepoint:
+        with session_factory() as session:
+            yield session
+        savepoint.rollback()
+
+
+@pytest.fixture
+def bulk_create(dbsession):
+    """
+    Provide a helper that inserts many rows of a model in a single INSERT.
+
+    Call it as bulk_create(Model, [{...}, {...}]); it returns the new instances.
+    """
+    def create(model, rows):
+        return dbsession.scalars(insert(model).returning(model), rows).all()
+    return create
+
+
+@pytest.fixture(scope="module")
+def category_id(connection, session_factory):
+    """
+    Provide the ID of a category shared by every test in a module.
+
+    The category is inserted once, in a SAVEPOINT that wraps the module's tests and
+    is rolled back after the last of them.
+    """
+    with connection.begin_nested() as savepoint:
+        with session_factory() as session:
+            category = BaseOperations.create_fast(
+                session,
+                Category,
+                name="Test Category",
+                description="For testing budgets"
+            )
+            category_id = category.id
+            session.commit()
+        yield category_id
+        savepoint.rollback()
+
+
+@pytest.fixture(scope="module")
+def account_id(connection, session_factory):
+    """
+    Provide the ID of an account shared by every test in a module.
+
+    Like category_id, the account is inserted once in a SAVEPOINT that is rolled back
+    after the module's last test.
+    """
+    with connection.begin_nested() as savepoint:
+        with session_factory() as session:
+            account = BaseOperations.create_fast(
+                session,
+                Account,
+                name="Test Account",
+                balance=1000.00
+            )
+            account_id = account.id
+            session.commit()
+        yield account_id
+        savepoint.rollback()
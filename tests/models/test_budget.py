@@ -1,133 +1,44 @@
-import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from expense_tracker.models import Base, Budget, Category
+from expense_tracker.models import Budget
 from expense_tracker.db.operations import BaseOperations
 from datetime import date, timedelta
 
 # ADD COMMENTS TO THIS MODULE
 
-@pytest.fixture(scope="module")
-def engine():
-    return create_engine("sqlite:///:memory:")
-
-
-@pytest.fixture(scope="module")
-def tables(engine):
-    Base.metadata.create_all(engine)
-    yield
-    Base.metadata.drop_all(engine)
-
-
-@pytest.fixture
-def dbsession(engine, tables):
-    connection = engine.connect()
-    transaction = connection.begin()
-    Session = sessionmaker(bind=connection)
-    session = Session()
-    yield session
-    session.close()
-    transaction.rollback()
-    connection.close()
-
-
-@pytest.fixture
-def category(dbsession):
-    return BaseOperations.create(
-        dbsession,
-        Category,
-        name="Test Category",
-        description="For testing budgets"
-    )
-
-
-def test_create_budget(dbsession, category):
-    new_budget = BaseOperations.create(
-        dbsession,
-        Budget,
-        category_id=category.id,
-        amount=300.00,
-        start_date=date.today(),
-        end_date=date.today() + timedelta(days=30)
-    )
-    assert new_budget.id is not None
-    assert new_budget.amount == 300.00
-    assert new_budget.category_id == category.id
-
-
-def test_read_budget(dbsession, category):
-    budget = BaseOperations.create(
-        dbsession,
-        Budget,
-        category_id=category.id,
-        amount=200.00,
-        start_date=date.today(),
-        end_date=date.today() + timedelta(days=30)
-    )
-    read_budget = BaseOperations.read(dbsession, Budget, budget.id)
-    assert read_budget is not None
-    assert read_budget.amount == 200.00
-    assert read_budget.category_id == category.id
-
-
-def test_update_budget(dbsession, category):
-    budget = BaseOperations.create(
-        dbsession,
-        Budget,
-        category_id=category.id,
-        amount=100.00,
-        start_date=date.today(),
-        end_date=date.today() + timedelta(days=30)
-    )
-    updated_budget = BaseOperations.update(
-        dbsession,
-        Budget,
-        budget.id,
-        amount=150.00
-    )
-    assert updated_budget.amount == 150.00
-
-
-def test_delete_budget(dbsession, category):
-    budget = BaseOperations.create(
-        dbsession,
-        Budget,
-        category_id=category.id,
-        amount=50.00,
-        start_date=date.today(),
-        end_date=date.today() + timedelta(days=30)
-    )
-    deleted = BaseOperations.delete(dbsession, Budget, budget.id)
-    assert deleted is True
-    assert BaseOperations.read(dbsession, Budget, budget.id) is None
-
-
-def test_get_all_budgets(dbsession, category):
-    for i in range(5):
-        BaseOperations.create(
-            dbsession,
-            Budget,
-            category_id=category.id,
-            amount=100.00 * (i + 1),
-            start_date=date.today(),
-            end_date=date.today() + timedelta(days=30 * (i + 1))
-        )
+# Dates used when seeding rows, built once rather than per row
+TODAY = date.today()
+IN_30_DAYS = TODAY + timedelta(days=30)
+# End dates 30, 60, ... 150 days out, one per budget in test_get_all_budgets
+END_DATES = [TODAY + timedelta(days=30 * (i + 1)) for i in range(5)]
+
+
+def test_get_all_budgets(dbsession, bulk_create, category_id):
+    bulk_create(Budget, [
+        {
+            "name": f"Budget {i}",
+            "category_id": category_id,
+            "amount": 100.00 * (i + 1),
+            "start_date": TODAY,
+            "end_date": END_DATES[i]
+        }
+        for i in range(5)
+    ])
     budgets, total = BaseOperations.get_all(dbsession, Budget, page=1, per_page=10)
     assert len(budgets) == 5
     assert total == 5
 
 
-def test_query_budgets(dbsession, category):
+def test_query_budgets(dbsession, bulk_create, category_id):
     # Create budgets with different amounts
-    for i in range(5):
-        BaseOperations.create(
-            dbsession,
-            Budget,
-            category_id=category.id,
-            amount=50.00 * (i + 1),  # This will create budgets with amounts 50, 100, 150, 200, 250
-            start_date=date.today(),
-            end_date=date.today() + timedelta(days=30)
-        )
+    bulk_create(Budget, [
+        {
+            "name": f"Budget {i}",
+            "category_id": category_id,
+            "amount": 50.00 * (i + 1),  # This will create budgets with amounts 50, 100, 150, 200, 250
+            "start_date": TODAY,
+            "end_date": IN_30_DAYS
+        }
+        for i in range(5)
+    ])
 
     low_budgets, total = BaseOperations.query(
         dbsession,
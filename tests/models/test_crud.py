@@ -0,0 +1,87 @@
+import pytest
+from expense_tracker.models import Account, Budget, Category, Transaction, TransactionType, IntervalType
+from expense_tracker.db.operations import BaseOperations
+from datetime import date, timedelta
+
+
+# Each factory takes the shared account and category IDs and returns
+# (fields to create with, fields to update)
+def _account(account_id, category_id):
+    return {"name": "Checking Account", "balance": 1000.00}, {"balance": -100.00}
+
+
+def _category(account_id, category_id):
+    return (
+        {"name": "Utilities", "description": "Electricity, water, gas"},
+        {"description": "Electricity, water, gas, internet"}
+    )
+
+
+def _budget(account_id, category_id):
+    return (
+        {
+            "name": "Utilities Budget",
+            "category_id": category_id,
+            "amount": 300.00,
+            "start_date": date.today(),
+            "end_date": date.today() + timedelta(days=30)
+        },
+        {"amount": 150.00}
+    )
+
+
+def _transaction(account_id, category_id):
+    return (
+        {
+            "name": "Test Transaction",
+            "amount": 100.00,
+            "account_id": account_id,
+            "category_id": category_id,
+            "type": TransactionType.EXPENSE,
+            "date": date.today(),
+            "description": "Test Transaction Description",
+            "interval": IntervalType.ONCE
+        },
+        {
+            "name": "Updated Transaction",
+            "amount": 100.00,
+            "type": TransactionType.EXPENSE,
+            "description": "Updated Transaction Description",
+            "interval": IntervalType.MONTHLY
+        }
+    )
+
+
+def _assert_fields(instance, fields):
+    for attr, value in fields.items():
+        assert getattr(instance, attr) == value
+
+
+@pytest.mark.parametrize("model, factory", [
+    pytest.param(Account, _account, id="account"),
+    pytest.param(Category, _category, id="category"),
+    pytest.param(Budget, _budget, id="budget"),
+    pytest.param(Transaction, _transaction, id="transaction"),
+])
+def test_crud_roundtrip(dbsession, account_id, category_id, model, factory):
+    fields, changes = factory(account_id, category_id)
+
+    # Create an instance and check it was stored as given
+    instance = BaseOperations.create(dbsession, model, **fields)
+    assert instance.id is not None
+    _assert_fields(instance, fields)
+
+    # Read it back
+    read_instance = BaseOperations.read(dbsession, model, instance.id)
+    assert read_instance is not None
+    _assert_fields(read_instance, fields)
+
+    # Update it; fields that weren't changed keep their values
+    updated_instance = BaseOperations.update(dbsession, model, instance.id, **changes)
+    assert updated_instance is not None
+    _assert_fields(updated_instance, {**fields, **changes})
+
+    # Delete it
+    deleted = BaseOperations.delete(dbsession, model, instance.id)
+    assert deleted is True
+    assert BaseOperations.read(dbsession, model, instance.id) is None
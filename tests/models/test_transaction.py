@@ -1,139 +1,25 @@
-import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from expense_tracker.models import Base, Transaction, TransactionType, IntervalType
+from expense_tracker.models import Transaction, TransactionType
 from expense_tracker.db.operations import BaseOperations
 from datetime import date, timedelta
 
-# Setup test database
-@pytest.fixture(scope="module")
-def engine():
-    return create_engine("sqlite:///:memory:")
+# Dates used when seeding rows, built once rather than per row
+TODAY = date.today()
+PAST_DATES = [TODAY - timedelta(days=i) for i in range(5)]
 
-@pytest.fixture(scope="module")
-def tables(engine):
-    Base.metadata.create_all(engine)
-    yield
-    Base.metadata.drop_all(engine)
 
-@pytest.fixture
-def dbsession(engine, tables):
-    connection = engine.connect()
-    transaction = connection.begin()
-    Session = sessionmaker(bind=connection)
-    session = Session()
-    yield session
-    session.close()
-    transaction.rollback()
-    connection.close()
-
-def test_create_transaction(dbsession):
-    # Create a new transaction
-    new_transaction = BaseOperations.create(
-        dbsession,
-        Transaction,
-        name="Test Transaction",
-        amount=100.00,
-        type=TransactionType.EXPENSE,
-        date=date.today(),
-        description="Test Transaction Description",
-        interval=IntervalType.ONCE
-    )
-
-    # Check if the transaction was created
-    assert new_transaction.id is not None
-    assert new_transaction.name == "Test Transaction"
-    assert new_transaction.amount == 100.00
-    assert new_transaction.type == TransactionType.EXPENSE
-    assert new_transaction.description == "Test Transaction Description"
-    assert new_transaction.interval == IntervalType.ONCE
-
-def test_read_transaction(dbsession):
-    # Create a transaction
-    transaction = BaseOperations.create(
-        dbsession,
-        Transaction,
-        name="Read Test",
-        amount=50.00,
-        type=TransactionType.INCOME,
-        date=date.today(),
-        description="Read Description Test",
-        interval=IntervalType.ONCE
-    )
-
-    # Read the transaction
-    read_transaction = BaseOperations.read(dbsession, Transaction, transaction.id)
-
-    # Check if the read transaction matches the created one
-    assert read_transaction is not None
-    assert read_transaction.name == "Read Test"
-    assert read_transaction.amount == 50.00
-    assert read_transaction.type == TransactionType.INCOME
-    assert read_transaction.description == "Read Description Test"
-    assert read_transaction.interval == IntervalType.ONCE
-
-def test_update_transaction(dbsession):
-    # Create a transaction
-    transaction = BaseOperations.create(
-        dbsession,
-        Transaction,
-        name="Update Test",
-        amount=75.00,
-        type=TransactionType.EXPENSE,
-        date=date.today(),
-        description="Update Transaction Description",
-        interval=IntervalType.ONCE
-    )
-
-    # Update the transaction
-    updated_transaction = BaseOperations.update(
-        dbsession,
-        Transaction,
-        transaction.id,
-        name="Updated Transaction",
-        amount=100.00,
-        type=TransactionType.RECURRING_EXPENSE,
-        description="Updated Transaction Description",
-        interval=IntervalType.MONTHLY
-    )
-
-    # Check if the transaction was updated
-    assert updated_transaction is not None
-    assert updated_transaction.name == "Updated Transaction"
-    assert updated_transaction.amount == 100.00
-    assert updated_transaction.type == TransactionType.RECURRING_EXPENSE
-    assert updated_transaction.description == "Updated Transaction Description"
-    assert updated_transaction.interval == IntervalType.MONTHLY
-
-def test_delete_transaction(dbsession):
-    # Create a transaction
-    transaction = BaseOperations.create(
-        dbsession,
-        Transaction,
-        name="Delete Test",
-        amount=25.00,
-        type=TransactionType.INCOME,
-        date=date.today()
-    )
-
-    # Delete the transaction
-    deleted = BaseOperations.delete(dbsession, Transaction, transaction.id)
-
-    # Check if the transaction was deleted
-    assert deleted is True
-    assert BaseOperations.read(dbsession, Transaction, transaction.id) is None
-
-def test_get_all_transactions(dbsession):
+def test_get_all_transactions(dbsession, bulk_create, account_id, category_id):
     # Create multiple transactions
-    for i in range(5):
-        BaseOperations.create(
-            dbsession,
-            Transaction,
-            name=f"Transaction {i}",
-            amount=10.00 * i,
-            type=TransactionType.EXPENSE,
-            date=date.today() - timedelta(days=i)
-        )
+    bulk_create(Transaction, [
+        {
+            "name": f"Transaction {i}",
+            "amount": 10.00 * i,
+            "account_id": account_id,
+            "category_id": category_id,
+            "type": TransactionType.EXPENSE,
+            "date": PAST_DATES[i]
+        }
+        for i in range(5)
+    ])
 
     # Get all transactions
     transactions, total = BaseOperations.get_all(dbsession, Transaction, page=1, per_page=10)
@@ -142,26 +28,31 @@ def test_get_all_transactions(dbsession):
     assert len(transactions) == 5
     assert total == 5
 
-def test_query_transactions(dbsession):
+def test_query_transactions(dbsession, bulk_create, account_id, category_id):
     # Create transactions with different types and amounts
-    for i in range(3):
-        BaseOperations.create(
-            dbsession,
-            Transaction,
-            name=f"Expense {i}",
-            amount=10.00 * (i + 1),
-            type=TransactionType.EXPENSE,
-            date=date.today() - timedelta(days=i)
-        )
-    for i in range(2):
-        BaseOperations.create(
-            dbsession,
-            Transaction,
-            name=f"Income {i}",
-            amount=100.00 * (i + 1),
-            type=TransactionType.INCOME,
-            date=date.today() - timedelta(days=i)
-        )
+    expense_rows = [
+        {
+            "name": f"Expense {i}",
+            "amount": 10.00 * (i + 1),
+            "account_id": account_id,
+            "category_id": category_id,
+            "type": TransactionType.EXPENSE,
+            "date": PAST_DATES[i]
+        }
+        for i in range(3)
+    ]
+    income_rows = [
+        {
+            "name": f"Income {i}",
+            "amount": 100.00 * (i + 1),
+            "account_id": account_id,
+            "category_id": category_id,
+            "type": TransactionType.INCOME,
+            "date": PAST_DATES[i]
+        }
+        for i in range(2)
+    ]
+    bulk_create(Transaction, expense_rows + income_rows)
 
     # Query only expense transactions
     expenses, total = BaseOperations.query(
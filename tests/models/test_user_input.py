@@ -1,94 +1,89 @@
 import pytest
-from datetime import datetime
-from expense_tracker.cli import UserInput
-from expense_tracker.utils.input_helpers import EXIT_COMMANDS
+from datetime import date, datetime
+from expense_tracker.models import Category
+from expense_tracker.db.operations import BaseOperations
+from expense_tracker.utils import input_helpers
+from expense_tracker.utils.input_helpers import (
+    UserInput, validate_date, get_model_instance_id, display_model_instances, get_related_instance_id,
+    INVALID_INT_MSG, INVALID_FLOAT_MSG, INVALID_DATE_MSG, INTERRUPT_MSG
+)
 
+# The date most get_date tests expect back
+_EXPECTED_DATE = date(2023, 10, 5)
 
-class TestGetInt:
-    """
-    Tests for the get_int method of UserInput class.
-    """
-
-    @pytest.fixture
-    def mock_print(self, mocker):
-        return mocker.patch('builtins.print')
 
-    def test_returns_integer_within_range(self, mocker):
-        mocker.patch('builtins.input', return_value='5')
-        result = UserInput.get_int("Enter a number: ", min_value=1, max_value=10)
-        assert result == 5
-
-    def test_returns_exit_on_exit_input(self, mocker):
-        mocker.patch('builtins.input', return_value='exit')
-        result = UserInput.get_int("Enter a number: ")
-        assert result == 'exit'
-
-    def test_returns_exit_on_quit_input(self, mocker):
-        mocker.patch('builtins.input', return_value='quit')
-        result = UserInput.get_int("Enter a number: ")
-        assert result == 'exit'
+def _seq(*responses):
+    """
+    Build a stand-in for safe_input() that answers with each response in turn.
 
-    def test_returns_integer_no_range(self, mocker):
-        mocker.patch('builtins.input', return_value='7')
-        result = UserInput.get_int("Enter a number: ")
-        assert result == 7
+    Exception classes among the responses are raised instead of returned, to simulate
+    interrupted input.
+    """
+    remaining = iter(responses)
 
-    def test_handles_non_integer_input(self, mocker, mock_print):
-        mocker.patch('builtins.input', side_effect=['abc', '5'])
-        result = UserInput.get_int("Enter a number: ")
-        assert result == 5
-        mock_print.assert_called_with(
-            f"Invalid input. Please enter a valid number (integer) or {' / '.join(EXIT_COMMANDS)} to quit.")
+    def scripted_input(prompt=''):
+        response = next(remaining)
+        if isinstance(response, type) and issubclass(response, BaseException):
+            raise response
+        return response
 
-    def test_handles_below_min_value(self, mocker, mock_print):
-        mocker.patch('builtins.input', side_effect=['0', '5'])
-        result = UserInput.get_int("Enter a number: ", min_value=1)
-        assert result == 5
-        mock_print.assert_called()
+    return scripted_input
 
-    def test_handles_above_max_value(self, mocker, mock_print):
-        mocker.patch('builtins.input', side_effect=['11', '5'])
-        result = UserInput.get_int("Enter a number: ", max_value=10)
-        assert result == 5
-        mock_print.assert_called()
 
-    def test_handles_no_min_max_values(self, mocker):
-        mocker.patch('builtins.input', return_value='5')
-        result = UserInput.get_int("Enter a number: ")
-        assert result == 5
+@pytest.fixture
+def script_input(monkeypatch):
+    """
+    Provide a function that scripts the user's responses for the rest of the test.
+    """
+    def script(*responses):
+        monkeypatch.setattr(input_helpers, 'safe_input', _seq(*responses))
+    return script
 
-    def test_handles_only_min_value_specified(self, mocker, mock_print):
-        mocker.patch('builtins.input', side_effect=['0', '3'])
-        result = UserInput.get_int("Enter a number: ", min_value=1)
-        assert result == 3
-        mock_print.assert_called()
-
-    def test_handles_only_max_value_specified(self, mocker, mock_print):
-        mocker.patch('builtins.input', side_effect=['11', '7'])
-        result = UserInput.get_int("Enter a number: ", max_value=10)
-        assert result == 7
-        mock_print.assert_called()
-
-    def test_handles_eoferror_during_input(self, mocker, mock_print):
-        mocker.patch('builtins.input', side_effect=[EOFError, '5'])
-        result = UserInput.get_int("Enter a number:")
-        assert result == 5
-        mock_print.assert_called_with(
-            f"\nInput interrupted. Please try again or type {' / '.join(EXIT_COMMANDS)} to quit.")
 
-    def test_handles_keyboardinterrupt_during_input(self, mocker, mock_print):
-        mocker.patch('builtins.input', side_effect=[KeyboardInterrupt, '5'])
-        result = UserInput.get_int("Enter a number:")
-        assert result == 5
-        mock_print.assert_called_with(
-            f"\nInput interrupted. Please try again or type {' / '.join(EXIT_COMMANDS)} to quit.")
+class TestGetInt:
+    """
+    Tests for the get_int method of UserInput class.
+    """
 
-    def test_decimal_input(self, mocker, mock_print):
-        mocker.patch('builtins.input', side_effect=['5.5', '5'])
+    @pytest.mark.parametrize("value, limits, expected", [
+        pytest.param('5', {'min_value': 1, 'max_value': 10}, 5, id="within_range"),
+        pytest.param('7', {}, 7, id="no_range"),
+        pytest.param('-5', {}, -5, id="negative"),
+        pytest.param('+5', {}, 5, id="explicit_plus_sign"),
+        pytest.param(' 5 ', {}, 5, id="with_spaces"),
+        pytest.param('exit', {}, 'exit', id="exit"),
+        pytest.param('quit', {}, 'exit', id="quit"),
+        pytest.param('EXIT', {}, 'exit', id="exit_upper"),
+        pytest.param('Quit', {}, 'exit', id="quit_capitalized"),
+    ])
+    def test_returns_valid_input(self, script_input, value, limits, expected):
+        script_input(value)
+        result = UserInput.get_int("Enter a number: ", **limits)
+        assert result == expected
+
+    @pytest.mark.parametrize("responses, limits, expected", [
+        pytest.param(['0', '5'], {'min_value': 1}, 5, id="below_min"),
+        pytest.param(['11', '5'], {'max_value': 10}, 5, id="above_max"),
+        pytest.param(['0', '3'], {'min_value': 1}, 3, id="only_min_specified"),
+        pytest.param(['11', '7'], {'max_value': 10}, 7, id="only_max_specified"),
+    ])
+    def test_reprompts_when_out_of_range(self, script_input, capsys, responses, limits, expected):
+        script_input(*responses)
+        result = UserInput.get_int("Enter a number: ", **limits)
+        assert result == expected
+        assert capsys.readouterr().out
+
+    @pytest.mark.parametrize("value", [
+        pytest.param('abc', id="non_integer"),
+        pytest.param('5.5', id="decimal"),
+        # int() accepts digit separators, but the prompt doesn't
+        pytest.param('1_000', id="underscore_separator"),
+    ])
+    def test_reprompts_on_invalid_input(self, script_input, capsys, value):
+        script_input(value, '5')
         result = UserInput.get_int("Enter a number: ")
         assert result == 5
-        mock_print.assert_called_with(
-            f"Invalid input. Please enter a valid number (integer) or {' / '.join(EXIT_COMMANDS)} to quit.")
+        assert INVALID_INT_MSG in capsys.readouterr().out
 
 
 class TestGetFloat:
@@ -96,99 +91,53 @@ class TestGetFloat:
     Tests for the get_float method of the UserInput class.
     """
 
-    @pytest.fixture
-    def mock_print(self, mocker):
-        return mocker.patch('builtins.print')
-
-    def test_valid_float_within_range(self, mocker):
-        mocker.patch('builtins.input', return_value='50.5')
-        result = UserInput.get_float("Enter a float: ", min_value=0.0, max_value=100.0)
-        assert result == 50.5
-
-    def test_valid_float_no_range(self, mocker):
-        mocker.patch('builtins.input', return_value='25.75')
-        result = UserInput.get_float("Enter a float: ")
-        assert result == 25.75
-
-    def test_exit_command(self, mocker):
-        mocker.patch('builtins.input', return_value='exit')
-        result = UserInput.get_float("Enter a float: ")
-        assert result == 'exit'
-
-    def test_quit_command(self, mocker):
-        mocker.patch('builtins.input', return_value='quit')
-        result = UserInput.get_float("Enter a float: ")
-        assert result == 'exit'
-
-    def test_float_at_min_boundary(self, mocker):
-        mocker.patch('builtins.input', return_value='0.0')
-        result = UserInput.get_float("Enter a float: ", min_value=0.0, max_value=100.0)
-        assert result == 0.0
-
-    def test_float_at_max_boundary(self, mocker):
-        mocker.patch('builtins.input', return_value='100.0')
-        result = UserInput.get_float("Enter a float: ", min_value=0.0, max_value=100.0)
-        assert result == 100.0
-
-    def test_float_below_min_boundary(self, mocker, mock_print):
-        mocker.patch('builtins.input', side_effect=['-1.0', '50.0'])
+    @pytest.mark.parametrize("value, limits, expected", [
+        pytest.param('50.5', {'min_value': 0.0, 'max_value': 100.0}, 50.5, id="within_range"),
+        pytest.param('25.75', {}, 25.75, id="no_range"),
+        pytest.param('exit', {}, 'exit', id="exit"),
+        pytest.param('quit', {}, 'exit', id="quit"),
+        pytest.param('0.0', {'min_value': 0.0, 'max_value': 100.0}, 0.0, id="at_min_boundary"),
+        pytest.param('100.0', {'min_value': 0.0, 'max_value': 100.0}, 100.0, id="at_max_boundary"),
+        pytest.param(' 42.42 ', {}, 42.42, id="with_spaces"),
+        pytest.param('1e308', {}, 1e308, id="very_large"),
+        pytest.param('1e-308', {}, 1e-308, id="very_small"),
+        pytest.param('5', {}, 5.0, id="integer"),
+        pytest.param('-1.5e3', {}, -1500.0, id="negative_exponent_form"),
+        pytest.param('.5', {}, 0.5, id="no_leading_digit"),
+    ])
+    def test_returns_valid_input(self, script_input, value, limits, expected):
+        script_input(value)
+        result = UserInput.get_float("Enter a float: ", **limits)
+        assert result == expected
+
+    @pytest.mark.parametrize("value", [
+        pytest.param('-1.0', id="below_min_boundary"),
+        pytest.param('101.0', id="above_max_boundary"),
+    ])
+    def test_reprompts_when_out_of_range(self, script_input, capsys, value):
+        script_input(value, '50.0')
         result = UserInput.get_float("Enter a float: ", min_value=0.0, max_value=100.0)
         assert result == 50.0
-        mock_print.assert_called()
-
-    def test_float_above_max_boundary(self, mocker, mock_print):
-        mocker.patch('builtins.input', side_effect=['101.0', '50.0'])
-        result = UserInput.get_float("Enter a float: ", min_value=0.0, max_value=100.0)
-        assert result == 50.0
-        mock_print.assert_called()
-
-    def test_non_numeric_string(self, mocker, mock_print):
-        mocker.patch('builtins.input', side_effect=['abc', '42.0'])
+        assert capsys.readouterr().out
+
+    @pytest.mark.parametrize("value", [
+        pytest.param('abc', id="non_numeric"),
+        pytest.param('', id="empty"),
+        # float() accepts digit separators, but the prompt doesn't
+        pytest.param('1_0.5', id="underscore_separator"),
+    ])
+    def test_reprompts_on_invalid_input(self, script_input, capsys, value):
+        script_input(value, '42.0')
         result = UserInput.get_float("Enter a float: ")
         assert result == 42.0
-        mock_print.assert_called_with(
-            f"Invalid input. Please enter a valid number (float) or {' / '.join(EXIT_COMMANDS)} to quit.")
+        assert INVALID_FLOAT_MSG in capsys.readouterr().out
 
-    def test_empty_string(self, mocker, mock_print):
-        mocker.patch('builtins.input', side_effect=['', '42.0'])
+    def test_reprompts_on_nan_without_range(self, script_input, capsys):
+        # NaN is outside every range, including the open one
+        script_input('nan', '42.0')
         result = UserInput.get_float("Enter a float: ")
         assert result == 42.0
-        mock_print.assert_called_with(
-            f"Invalid input. Please enter a valid number (float) or {' / '.join(EXIT_COMMANDS)} to quit.")
-
-    def test_float_with_spaces(self, mocker):
-        mocker.patch('builtins.input', return_value=' 42.42 ')
-        result = UserInput.get_float("Enter a float: ")
-        assert result == 42.42
-
-    def test_very_large_float(self, mocker):
-        mocker.patch('builtins.input', return_value='1e308')
-        result = UserInput.get_float("Enter a float: ")
-        assert result == 1e308
-
-    def test_very_small_float(self, mocker):
-        mocker.patch('builtins.input', return_value='1e-308')
-        result = UserInput.get_float("Enter a float: ")
-        assert result == 1e-308
-
-    def test_handles_eoferror_during_input(self, mocker, mock_print):
-        mocker.patch('builtins.input', side_effect=[EOFError, '5.0'])
-        result = UserInput.get_float("Enter a float:")
-        assert result == 5.0
-        mock_print.assert_called_with(
-            f"\nInput interrupted. Please try again or type {' / '.join(EXIT_COMMANDS)} to quit.")
-
-    def test_handles_keyboardinterrupt_during_input(self, mocker, mock_print):
-        mocker.patch('builtins.input', side_effect=[KeyboardInterrupt, '5.0'])
-        result = UserInput.get_float("Enter a float:")
-        assert result == 5.0
-        mock_print.assert_called_with(
-            f"\nInput interrupted. Please try again or type {' / '.join(EXIT_COMMANDS)} to quit.")
-
-    def test_integer_input(self, mocker):
-        mocker.patch('builtins.input', return_value='5')
-        result = UserInput.get_float("Enter a float: ")
-        assert result == 5.0
+        assert capsys.readouterr().out
 
 
 class TestGetString:
@@ -196,101 +145,35 @@ class TestGetString:
     Tests for the get_string method of the UserInput class.
     """
 
-    @pytest.fixture
-    def mock_print(self, mocker):
-        return mocker.patch('builtins.print')
-
-    def test_valid_string_within_length_range(self, mocker):
-        mocker.patch('builtins.input', return_value='validstring')
-        result = UserInput.get_string("Enter a string: ", min_length=3, max_length=20)
-        assert result == 'validstring'
-
-    def test_valid_string_without_length_constraints(self, mocker):
-        mocker.patch('builtins.input', return_value='anystring')
-        result = UserInput.get_string("Enter a string: ")
-        assert result == 'anystring'
-
-    def test_exit_command_terminates_input(self, mocker):
-        mocker.patch('builtins.input', return_value='exit')
-        result = UserInput.get_string("Enter a string: ")
-        assert result == 'exit'
-
-    def test_quit_command_terminates_input(self, mocker):
-        mocker.patch('builtins.input', return_value='quit')
-        result = UserInput.get_string("Enter a string: ")
-        assert result == 'exit'
-
-    def test_string_shorter_than_min_length(self, mocker, mock_print):
-        mocker.patch('builtins.input', side_effect=['ab', 'validstring'])
-        result = UserInput.get_string("Enter a string: ", min_length=3)
-        assert result == 'validstring'
-        mock_print.assert_called()
-
-    def test_string_longer_than_max_length(self, mocker, mock_print):
-        mocker.patch('builtins.input', side_effect=['toolongstring', 'valid'])
-        result = UserInput.get_string("Enter a string: ", max_length=10)
-        assert result == 'valid'
-        mock_print.assert_called()
-
-    def test_empty_string_no_constraints(self, mocker):
-        mocker.patch('builtins.input', return_value='')
-        result = UserInput.get_string("Enter a string: ")
-        assert result == ''
-
-    def test_string_at_min_length_boundary(self, mocker):
-        mocker.patch('builtins.input', return_value='abc')
-        result = UserInput.get_string("Enter a string: ", min_length=3)
-        assert result == 'abc'
-
-    def test_string_at_max_length_boundary(self, mocker):
-        mocker.patch('builtins.input', return_value='abcdefghij')
-        result = UserInput.get_string("Enter a string: ", max_length=10)
-        assert result == 'abcdefghij'
-
-    def test_string_with_leading_trailing_spaces(self, mocker):
-        mocker.patch('builtins.input', return_value='  spaced  ')
-        result = UserInput.get_string("Enter a string: ")
-        assert result == 'spaced'
-
-    def test_string_with_special_characters(self, mocker):
-        mocker.patch('builtins.input', return_value='!@#$%^&*()')
-        result = UserInput.get_string("Enter a string: ")
-        assert result == '!@#$%^&*()'
-
-    def test_string_with_numeric_characters(self, mocker):
-        mocker.patch('builtins.input', return_value='1234567890')
-        result = UserInput.get_string("Enter a string: ")
-        assert result == '1234567890'
-
-    def test_string_with_mixed_case_characters(self, mocker):
-        mocker.patch('builtins.input', return_value='MiXeDcAsE')
-        result = UserInput.get_string("Enter a string: ")
-        assert result == 'MiXeDcAsE'
-
-    def test_handles_eoferror_during_input(self, mocker, mock_print):
-        mocker.patch('builtins.input', side_effect=[EOFError, 'valid_string'])
-        result = UserInput.get_string("Enter a string:")
-        assert result == 'valid_string'
-        mock_print.assert_called_with(
-            f"\nInput interrupted. Please try again or type {' / '.join(EXIT_COMMANDS)} to quit.")
-
-    def test_handles_keyboardinterrupt_during_input(self, mocker, mock_print):
-        mocker.patch('builtins.input', side_effect=[KeyboardInterrupt, 'valid_string'])
-        result = UserInput.get_string("Enter a string:")
-        assert result == 'valid_string'
-        mock_print.assert_called_with(
-            f"\nInput interrupted. Please try again or type {' / '.join(EXIT_COMMANDS)} to quit.")
-
-    def test_whitespace_string_with_min_length(self, mocker, mock_print):
-        mocker.patch('builtins.input', side_effect=['   ', 'valid'])
-        result = UserInput.get_string("Enter a string: ", min_length=1)
-        assert result == 'valid'
-        mock_print.assert_called()
-
-    def test_whitespace_string_without_length_constraints(self, mocker):
-        mocker.patch('builtins.input', return_value='   ')
-        result = UserInput.get_string("Enter a string: ")
-        assert result == ''
+    @pytest.mark.parametrize("value, limits, expected", [
+        pytest.param('validstring', {'min_length': 3, 'max_length': 20}, 'validstring', id="within_length_range"),
+        pytest.param('anystring', {}, 'anystring', id="no_length_constraints"),
+        pytest.param('exit', {}, 'exit', id="exit"),
+        pytest.param('quit', {}, 'exit', id="quit"),
+        pytest.param('', {}, '', id="empty_no_constraints"),
+        pytest.param('abc', {'min_length': 3}, 'abc', id="at_min_length_boundary"),
+        pytest.param('abcdefghij', {'max_length': 10}, 'abcdefghij', id="at_max_length_boundary"),
+        pytest.param('  spaced  ', {}, 'spaced', id="leading_trailing_spaces"),
+        pytest.param('!@#$%^&*()', {}, '!@#$%^&*()', id="special_characters"),
+        pytest.param('1234567890', {}, '1234567890', id="numeric_characters"),
+        pytest.param('MiXeDcAsE', {}, 'MiXeDcAsE', id="mixed_case_characters"),
+        pytest.param('   ', {}, '', id="whitespace_no_constraints"),
+    ])
+    def test_returns_valid_input(self, script_input, value, limits, expected):
+        script_input(value)
+        result = UserInput.get_string("Enter a string: ", **limits)
+        assert result == expected
+
+    @pytest.mark.parametrize("responses, limits, expected", [
+        pytest.param(['ab', 'validstring'], {'min_length': 3}, 'validstring', id="shorter_than_min_length"),
+        pytest.param(['toolongstring', 'valid'], {'max_length': 10}, 'valid', id="longer_than_max_length"),
+        pytest.param(['   ', 'valid'], {'min_length': 1}, 'valid', id="whitespace_with_min_length"),
+    ])
+    def test_reprompts_when_length_out_of_range(self, script_input, capsys, responses, limits, expected):
+        script_input(*responses)
+        result = UserInput.get_string("Enter a string: ", **limits)
+        assert result == expected
+        assert capsys.readouterr().out
 
 
 class TestGetDate:
@@ -298,95 +181,132 @@ class TestGetDate:
     Tests for the get_date method of the UserInput class.
     """
 
-    @pytest.fixture
-    def mock_print(self, mocker):
-        return mocker.patch('builtins.print')
-
-    def test_valid_date_input(self, mocker):
-        mocker.patch('builtins.input', return_value='2023-10-05')
-        result = UserInput.get_date("Enter date:")
-        assert result == datetime(2023, 10, 5).date()
-
-    def test_exit_command(self, mocker):
-        mocker.patch('builtins.input', return_value='exit')
-        result = UserInput.get_date("Enter date:")
-        assert result == 'exit'
-
-    def test_quit_command(self, mocker):
-        mocker.patch('builtins.input', return_value='quit')
-        result = UserInput.get_date("Enter date:")
-        assert result == 'exit'
-
-    def test_date_with_spaces(self, mocker):
-        mocker.patch('builtins.input', return_value=' 2023-10-05 ')
-        result = UserInput.get_date("Enter date:")
-        assert result == datetime(2023, 10, 5).date()
-
-    def test_invalid_date_format(self, mocker, mock_print):
-        mocker.patch('builtins.input', side_effect=['10-05-2023', '2023-10-05'])
-        result = UserInput.get_date("Enter date:")
-        assert result == datetime(2023, 10, 5).date()
-        mock_print.assert_called_with(
-            f"Invalid date format. Please use YYYY-MM-DD or {' / '.join(EXIT_COMMANDS)} to quit.")
-
-    def test_non_date_string(self, mocker, mock_print):
-        mocker.patch('builtins.input', side_effect=['not-a-date', '2023-10-05'])
+    @pytest.mark.parametrize("value, expected", [
+        pytest.param('2023-10-05', _EXPECTED_DATE, id="valid_date"),
+        pytest.param('exit', 'exit', id="exit"),
+        pytest.param('quit', 'exit', id="quit"),
+        pytest.param(' 2023-10-05 ', _EXPECTED_DATE, id="with_spaces"),
+        # February 29 in a leap year (2024 is a leap year)
+        pytest.param('2024-02-29', date(2024, 2, 29), id="leap_year"),
+    ])
+    def test_returns_valid_input(self, script_input, value, expected):
+        script_input(value)
         result = UserInput.get_date("Enter date:")
-        assert result == datetime(2023, 10, 5).date()
-        mock_print.assert_called_with(
-            f"Invalid date format. Please use YYYY-MM-DD or {' / '.join(EXIT_COMMANDS)} to quit.")
-
-    def test_empty_string(self, mocker, mock_print):
-        mocker.patch('builtins.input', side_effect=['', '2023-10-05'])
-        result = UserInput.get_date("Enter date:")
-        assert result == datetime(2023, 10, 5).date()
-        mock_print.assert_called_with(
-            f"Invalid date format. Please use YYYY-MM-DD or {' / '.join(EXIT_COMMANDS)} to quit.")
-
-    def test_invalid_month_day_values(self, mocker, mock_print):
-        mocker.patch('builtins.input', side_effect=['2023-13-01', '2023-10-05'])
+        assert result == expected
+
+    @pytest.mark.parametrize("value", [
+        pytest.param('10-05-2023', id="invalid_date_format"),
+        pytest.param('not-a-date', id="non_date_string"),
+        pytest.param('', id="empty_string"),
+        pytest.param('2023-13-01', id="invalid_month_day_values"),
+        pytest.param('2023-10-05abc', id="extra_characters"),
+        pytest.param('05-10-2023', id="different_locale_format"),
+        pytest.param('2023/10/05', id="different_separator_format"),
+    ])
+    def test_reprompts_on_invalid_date(self, script_input, capsys, value):
+        script_input(value, '2023-10-05')
         result = UserInput.get_date("Enter date:")
-        assert result == datetime(2023, 10, 5).date()
-        mock_print.assert_called_with(
-            f"Invalid date format. Please use YYYY-MM-DD or {' / '.join(EXIT_COMMANDS)} to quit.")
-
-    def test_date_with_extra_characters(self, mocker, mock_print):
-        mocker.patch('builtins.input', side_effect=['2023-10-05abc', '2023-10-05'])
-        result = UserInput.get_date("Enter date:")
-        assert result == datetime(2023, 10, 5).date()
-        mock_print.assert_called_with(
-            f"Invalid date format. Please use YYYY-MM-DD or {' / '.join(EXIT_COMMANDS)} to quit.")
-
-    def test_eof_error_interrupt(self, mocker, mock_print):
-        mocker.patch('builtins.input', side_effect=[EOFError, '2023-10-05'])
-        result = UserInput.get_date("Enter date:")
-        assert result == datetime(2023, 10, 5).date()
-        mock_print.assert_called_with(
-            f"\nInput interrupted. Please try again or type {' / '.join(EXIT_COMMANDS)} to quit.")
-
-    def test_keyboard_interrupt(self, mocker, mock_print):
-        mocker.patch('builtins.input', side_effect=[KeyboardInterrupt, '2023-10-05'])
-        result = UserInput.get_date("Enter date:")
-        assert result == datetime(2023, 10, 5).date()
-        mock_print.assert_called_with(
-            f"\nInput interrupted. Please try again or type {' / '.join(EXIT_COMMANDS)} to quit.")
+        assert result == _EXPECTED_DATE
+        assert INVALID_DATE_MSG in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("interruption", [EOFError, KeyboardInterrupt])
+@pytest.mark.parametrize("prompt_function, response, expected", [
+    pytest.param(UserInput.get_int, '5', 5, id="get_int"),
+    pytest.param(UserInput.get_float, '5.0', 5.0, id="get_float"),
+    pytest.param(UserInput.get_string, 'valid_string', 'valid_string', id="get_string"),
+    pytest.param(UserInput.get_date, '2023-10-05', _EXPECTED_DATE, id="get_date"),
+])
+def test_reprompts_after_interrupted_input(script_input, capsys, prompt_function, response, expected, interruption):
+    script_input(interruption, response)
+    result = prompt_function("Enter a value: ")
+    assert result == expected
+    assert INTERRUPT_MSG in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("value, expected", [
+    pytest.param(_EXPECTED_DATE, True, id="date"),
+    pytest.param('2023-10-05', True, id="date_string"),
+    pytest.param('2023-13-01', False, id="invalid_date_string"),
+    pytest.param(datetime(2023, 10, 5, 12, 30), False, id="datetime_with_time"),
+    pytest.param(None, False, id="none"),
+    pytest.param(20231005, False, id="integer"),
+])
+def test_validate_date(value, expected):
+    assert validate_date(value) is expected
+
+
+class TestGetModelInstanceId:
+    """
+    Tests for get_model_instance_id, which checks listed IDs in memory and looks up the rest.
+    """
 
-    def test_different_locale_format(self, mocker, mock_print):
-        mocker.patch('builtins.input', side_effect=['05-10-2023', '2023-10-05'])
-        result = UserInput.get_date("Enter date:")
-        assert result == datetime(2023, 10, 5).date()
-        mock_print.assert_called_with(
-            f"Invalid date format. Please use YYYY-MM-DD or {' / '.join(EXIT_COMMANDS)} to quit.")
+    @pytest.fixture
+    def categories(self, bulk_create):
+        # One category that was listed to the user and one that wasn't
+        return bulk_create(Category, [{"name": "Listed"}, {"name": "Unlisted"}])
 
-    def test_different_separator_format(self, mocker, mock_print):
-        mocker.patch('builtins.input', side_effect=['2023/10/05', '2023-10-05'])
-        result = UserInput.get_date("Enter date:")
-        assert result == datetime(2023, 10, 5).date()
-        mock_print.assert_called_with(
-            f"Invalid date format. Please use YYYY-MM-DD or {' / '.join(EXIT_COMMANDS)} to quit.")
+    @pytest.fixture
+    def reads(self, monkeypatch):
+        # Record the IDs looked up in the database, still doing the real lookup
+        read_ids = []
+        read = BaseOperations.read
+
+        def recording_read(db, model_class, instance_id):
+            read_ids.append(instance_id)
+            return read(db, model_class, instance_id)
+
+        monkeypatch.setattr(BaseOperations, 'read', recording_read)
+        return read_ids
+
+    def test_accepts_listed_id_without_lookup(self, dbsession, script_input, categories, reads):
+        listed, _ = categories
+        script_input(str(listed.id))
+        result = get_model_instance_id(dbsession, Category, "Enter ID: ", frozenset({listed.id}))
+        assert result == listed.id
+        assert reads == []
+
+    def test_accepts_existing_unlisted_id(self, dbsession, script_input, categories, reads):
+        listed, unlisted = categories
+        script_input(str(unlisted.id))
+        result = get_model_instance_id(dbsession, Category, "Enter ID: ", frozenset({listed.id}))
+        assert result == unlisted.id
+        assert reads == [unlisted.id]
+
+    def test_reprompts_on_unknown_id(self, dbsession, script_input, capsys, categories):
+        listed, unlisted = categories
+        unknown_id = max(listed.id, unlisted.id) + 1
+        script_input(str(unknown_id), str(listed.id))
+        result = get_model_instance_id(dbsession, Category, "Enter ID: ", frozenset({listed.id}))
+        assert result == listed.id
+        assert "Invalid Category ID. Please try again." in capsys.readouterr().out
+
+
+class TestDisplayModelInstances:
+    """
+    Tests for display_model_instances and get_related_instance_id, which list a model's instances.
+    """
 
-    def test_leap_year_date(self, mocker):
-        # Test for February 29 in a leap year (2024 is a leap year)
-        mocker.patch('builtins.input', return_value='2024-02-29')
-        result = UserInput.get_date("Enter date:")
-        assert result == datetime(2024, 2, 29).date()
+    def test_display_without_instances(self, dbsession, capsys):
+        assert display_model_instances(dbsession, Category) == frozenset()
+        assert capsys.readouterr().out == "\nNo Category instances available. Please create one first.\n"
+
+    def test_display_lists_instances(self, dbsession, capsys, bulk_create):
+        food, rent = bulk_create(Category, [{"name": "Food"}, {"name": "Rent"}])
+        assert display_model_instances(dbsession, Category) == frozenset({food.id, rent.id})
+        assert capsys.readouterr().out == (
+            "\nAvailable Category instances:\n"
+            f"ID: {food.id} - Name: Food\n"
+            f"ID: {rent.id} - Name: Rent\n"
+            "\n"
+        )
+
+    def test_related_id_without_instances(self, dbsession, capsys):
+        assert get_related_instance_id(dbsession, Category) is None
+        assert "No Category instances available" in capsys.readouterr().out
+
+    def test_related_id_from_listed_instances(self, dbsession, script_input, capsys, bulk_create):
+        food, rent = bulk_create(Category, [{"name": "Food"}, {"name": "Rent"}])
+        script_input(str(rent.id))
+        assert get_related_instance_id(dbsession, Category) == rent.id
+        assert f"ID: {rent.id} - Name: Rent" in capsys.readouterr().out
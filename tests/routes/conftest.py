@@ -0,0 +1,9 @@
+import pytest
+from expense_tracker.app import app
+
+
+@pytest.fixture(scope="module")
+def client():
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
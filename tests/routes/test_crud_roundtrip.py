@@ -0,0 +1,61 @@
+import pytest
+from datetime import date, timedelta
+
+TODAY = date.today().isoformat()
+# First day of next month; safe in December and at the end of long months
+NEXT_MONTH = (date.today().replace(day=1) + timedelta(days=32)).replace(day=1).isoformat()
+
+
+@pytest.fixture(scope="module")
+def related(client):
+    # Account and category that budgets and transactions can point at
+    account = client.post('/accounts/', json={'name': 'Test Account', 'balance': 1000.00}).get_json()
+    category = client.post('/categories/', json={'name': 'Test Category'}).get_json()
+    return {'account_id': account['id'], 'category_id': category['id']}
+
+
+RESOURCES = [
+    pytest.param('/accounts/', lambda related: {
+        'name': 'Test Account',
+        'balance': 1000.00
+    }, id='account'),
+    pytest.param('/categories/', lambda related: {
+        'name': 'Test Category',
+        'description': 'This is a test category'
+    }, id='category'),
+    pytest.param('/budgets/', lambda related: {
+        'name': 'Test Budget',
+        'amount': 1000.00,
+        'category_id': related['category_id'],
+        'start_date': TODAY,
+        'end_date': NEXT_MONTH
+    }, id='budget'),
+    pytest.param('/transactions/', lambda related: {
+        'name': 'Test Transaction',
+        'amount': 100.00,
+        'account_id': related['account_id'],
+        'category_id': related['category_id'],
+        'date': TODAY,
+        'type': 'EXPENSE',
+        'interval': 'ONCE'
+    }, id='transaction'),
+]
+
+
+@pytest.mark.parametrize("endpoint, make_payload", RESOURCES)
+def test_crud_roundtrip(client, related, endpoint, make_payload):
+    payload = make_payload(related)
+
+    # First, create the resource
+    create_response = client.post(endpoint, json=payload)
+    assert create_response.status_code == 201
+    created = create_response.get_json()
+    for field, value in payload.items():
+        assert created[field] == value
+
+    # Then, get it back
+    response = client.get(f"{endpoint}{created['id']}")
+    assert response.status_code == 200
+    data = response.get_json()
+    for field, value in payload.items():
+        assert data[field] == value
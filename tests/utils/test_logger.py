@@ -0,0 +1,157 @@
+import logging
+import time
+import weakref
+import pytest
+from expense_tracker.utils import logger
+from expense_tracker.utils.logger import FastRotatingFileHandler
+
+
+def _record(message, level=logging.INFO):
+    return logging.LogRecord('test', level, __file__, 0, message, None, None)
+
+
+@pytest.fixture
+def make_handler(tmp_path):
+    """
+    Provide a factory for FastRotatingFileHandlers writing '<message>\\n' lines under tmp_path.
+
+    Every handler it creates is closed at the end of the test.
+    """
+    handlers = []
+
+    def make(name='test.log', **kwargs):
+        handler = FastRotatingFileHandler(tmp_path / name, encoding='utf-8', **kwargs)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        handlers.append(handler)
+        return handler
+
+    yield make
+    for handler in handlers:
+        handler.close()
+
+
+@pytest.mark.parametrize("message", [
+    pytest.param('a' * 60, id="ascii"),
+    # Two bytes per character in UTF-8, so the character count alone would undercount
+    pytest.param('é' * 60, id="non_ascii"),
+])
+def test_rollover_keeps_files_within_max_bytes(tmp_path, make_handler, message):
+    handler = make_handler(maxBytes=200, backupCount=20)
+    for _ in range(12):
+        handler.handle(_record(message))
+    handler.close()
+
+    record_size = len((message + '\n').encode('utf-8'))
+    sizes = [path.stat().st_size for path in tmp_path.iterdir()]
+
+    # The file was rolled over, nothing was lost, and no file grew past maxBytes
+    assert len(sizes) > 1
+    assert sum(sizes) == 12 * record_size
+    assert all(size <= 200 for size in sizes)
+
+
+@pytest.fixture
+def unflushed(monkeypatch):
+    """
+    Provide a function that hides a handler from the background flusher thread.
+
+    The thread flushes whatever is in the module's _buffered_handlers set on each pass,
+    so swapping in an empty set keeps it away from the handler under test.
+    """
+    def hide(handler):
+        monkeypatch.setattr(logger, '_buffered_handlers', weakref.WeakSet())
+        return handler
+    return hide
+
+
+def test_info_record_is_buffered_until_flush(tmp_path, make_handler, unflushed):
+    handler = unflushed(make_handler())
+    handler.handle(_record("buffered"))
+    assert (tmp_path / 'test.log').read_text(encoding='utf-8') == ''
+
+    handler.flush()
+    assert (tmp_path / 'test.log').read_text(encoding='utf-8') == 'buffered\n'
+
+
+def test_flusher_thread_writes_buffered_records(tmp_path, make_handler):
+    handler = make_handler()
+    handler.handle(_record("buffered"))
+
+    # The thread flushes every LOG_FLUSH_INTERVAL seconds; allow it plenty of passes
+    deadline = time.monotonic() + 50 * logger.LOG_FLUSH_INTERVAL
+    while (tmp_path / 'test.log').read_text(encoding='utf-8') == '' and time.monotonic() < deadline:
+        time.sleep(logger.LOG_FLUSH_INTERVAL / 4)
+    assert (tmp_path / 'test.log').read_text(encoding='utf-8') == 'buffered\n'
+
+
+def test_error_record_is_written_immediately(tmp_path, make_handler, unflushed):
+    handler = unflushed(make_handler())
+    handler.handle(_record("failed", level=logging.ERROR))
+    assert (tmp_path / 'test.log').read_text(encoding='utf-8') == 'failed\n'
+
+
+def test_close_unregisters_handler(make_handler):
+    handler = make_handler()
+    assert handler in logger._buffered_handlers
+
+    handler.close()
+    assert handler not in logger._buffered_handlers
+
+
+def test_flusher_starts_with_first_deferred_record(monkeypatch, make_handler, unflushed):
+    starts = []
+    monkeypatch.setattr(logger, '_flusher_thread', None)
+    monkeypatch.setattr(logger, '_start_flusher', lambda: starts.append(True))
+
+    handler = unflushed(make_handler())
+    handler.handle(_record("failed", level=logging.ERROR))
+    assert starts == []
+
+    handler.handle(_record("buffered"))
+    assert starts == [True]
+
+
+def test_flusher_survives_a_failing_handler(tmp_path, make_handler, monkeypatch, capsys):
+    broken = make_handler('broken.log')
+    working = make_handler('working.log')
+    failures = []
+
+    def failing_flush():
+        failures.append(True)
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(broken, 'flush', failing_flush)
+    # Buffering a record starts the flusher thread if nothing else has yet
+    working.handle(_record("first"))
+
+    # Let the flusher hit the broken handler, then check it still flushes the working one
+    deadline = time.monotonic() + 50 * logger.LOG_FLUSH_INTERVAL
+    while not failures and time.monotonic() < deadline:
+        time.sleep(logger.LOG_FLUSH_INTERVAL / 4)
+    assert failures
+
+    working.handle(_record("second"))
+    while ('second' not in (tmp_path / 'working.log').read_text(encoding='utf-8')
+           and time.monotonic() < deadline):
+        time.sleep(logger.LOG_FLUSH_INTERVAL / 4)
+    assert (tmp_path / 'working.log').read_text(encoding='utf-8') == 'first\nsecond\n'
+    assert 'No space left on device' in capsys.readouterr().err
+
+    # Give the broken handler its real flush back so it can be closed
+    monkeypatch.undo()
+
+
+def test_setup_logger_adds_handlers_once(tmp_path, request):
+    logs_dir = tmp_path / 'logs'
+    name = f'test_setup_logger.{request.node.name}'
+    configured = logger.setup_logger(name, 'test.log', logs_dir=logs_dir)
+
+    def remove_handlers():
+        for handler in list(configured.handlers):
+            configured.removeHandler(handler)
+            handler.close()
+    request.addfinalizer(remove_handlers)
+
+    assert logger.setup_logger(name, 'test.log', logs_dir=logs_dir) is configured
+    assert len(configured.handlers) == 2
+    assert logs_dir.is_dir()
@@ -0,0 +1,35 @@
+import pytest
+from expense_tracker.utils.validation import user_validation_message, DEFAULT_VALIDATION_MESSAGE
+
+
+@pytest.mark.parametrize("value, min_value, max_value, expected", [
+    # Numbers
+    pytest.param(0, 1, 10, "Please enter a value between 1 and 10.", id="number_below_range"),
+    pytest.param(11, 1, 10, "Please enter a value between 1 and 10.", id="number_above_range"),
+    pytest.param(5, 1, 10, DEFAULT_VALIDATION_MESSAGE, id="number_in_range"),
+    pytest.param(0, 1, None, "Please enter a value greater than or equal to 1.", id="number_below_min"),
+    pytest.param(1, 1, None, DEFAULT_VALIDATION_MESSAGE, id="number_at_min"),
+    pytest.param(11, None, 10, "Please enter a value less than or equal to 10.", id="number_above_max"),
+    pytest.param(10, None, 10, DEFAULT_VALIDATION_MESSAGE, id="number_at_max"),
+    pytest.param(5, None, None, DEFAULT_VALIDATION_MESSAGE, id="number_no_bounds"),
+    pytest.param(-1.5, 0.0, 100.0, "Please enter a value between 0.0 and 100.0.", id="float_below_range"),
+    # Strings are checked by length
+    pytest.param('ab', 3, 20, "Please enter a string with a length between 3 and 20.",
+                 id="string_shorter_than_range"),
+    pytest.param('a' * 21, 3, 20, "Please enter a string with a length between 3 and 20.",
+                 id="string_longer_than_range"),
+    pytest.param('validstring', 3, 20, DEFAULT_VALIDATION_MESSAGE, id="string_in_range"),
+    pytest.param('ab', 3, None, "Please enter a string with a length greater than or equal to 3.",
+                 id="string_below_min"),
+    pytest.param('abc', 3, None, DEFAULT_VALIDATION_MESSAGE, id="string_at_min"),
+    pytest.param('toolongstring', None, 10, "Please enter a string with a length less than or equal to 10.",
+                 id="string_above_max"),
+    pytest.param('abcdefghij', None, 10, DEFAULT_VALIDATION_MESSAGE, id="string_at_max"),
+    pytest.param('anything', None, None, DEFAULT_VALIDATION_MESSAGE, id="string_no_bounds"),
+])
+def test_user_validation_message(value, min_value, max_value, expected):
+    assert user_validation_message(value, min_value, max_value) == expected
+
+
+def test_default_validation_message():
+    assert DEFAULT_VALIDATION_MESSAGE == "The input does not meet the validation criteria."